@@ -5,13 +5,20 @@ This is the main application file that defines routes and initializes
 the Flask app.
 """
 
-from flask import Flask, render_template, request, jsonify, send_from_directory
+from flask import Flask, Response, render_template, request, jsonify, send_from_directory
 import os
+from datetime import datetime
 from pathlib import Path
 import logging
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # Import our modules
-from utils import setup_logging, validate_path, format_file_size
+from utils import setup_logging, validate_path, invalidate_path, format_file_size
 from organizer import scan_directory, organize_by_type, organize_by_date, organize_by_project
 from renamer import rename_screenshots
 from finder import scan_for_duplicates, remove_duplicates, archive_duplicates
@@ -75,7 +82,7 @@ def organize_preview():
             }), 400
         
         # Scan directory
-        files = scan_directory(directory)
+        files = list(scan_directory(directory))
         
         # Generate preview based on mode
         preview_data = []
@@ -83,18 +90,18 @@ def organize_preview():
         if mode == 'type':
             for file_info in files:
                 preview_data.append({
-                    'original': file_info['name'],
-                    'destination': f"{file_info['category']}/{file_info['name']}",
-                    'size': format_file_size(file_info['size'])
+                    'original': file_info.name,
+                    'destination': f"{file_info.category}/{file_info.name}",
+                    'size': format_file_size(file_info.size)
                 })
         
         elif mode == 'date':
             for file_info in files:
-                date_str = file_info['modified'].strftime('%Y-%m-%d')
+                date_str = datetime.fromtimestamp(file_info.mtime).strftime('%Y-%m-%d')
                 preview_data.append({
-                    'original': file_info['name'],
-                    'destination': f"{date_str}/{file_info['name']}",
-                    'size': format_file_size(file_info['size'])
+                    'original': file_info.name,
+                    'destination': f"{date_str}/{file_info.name}",
+                    'size': format_file_size(file_info.size)
                 })
         
         elif mode == 'project':
@@ -102,9 +109,9 @@ def organize_preview():
             # For preview, we'll just show uncategorized
             for file_info in files:
                 preview_data.append({
-                    'original': file_info['name'],
-                    'destination': f"Uncategorized/{file_info['name']}",
-                    'size': format_file_size(file_info['size'])
+                    'original': file_info.name,
+                    'destination': f"Uncategorized/{file_info.name}",
+                    'size': format_file_size(file_info.size)
                 })
         
         return jsonify({
@@ -154,6 +161,10 @@ def organize_execute():
                 'error': 'Invalid organization mode'
             }), 400
         
+        # Files were moved, so re-check these directories on the next request
+        invalidate_path(directory)
+        invalidate_path(target_dir)
+        
         return jsonify(result)
     
     except Exception as e:
@@ -380,8 +391,11 @@ def duplicates_scan():
         total_space = 0
         
         for group_hash, group_data in duplicate_groups.items():
-            # Calculate space that could be saved (all but one file)
-            space_saveable = sum(f['size'] for f in group_data['files'][1:])
+            # Calculate space that could be saved (all but one file). Files in
+            # a group have identical content, so the size is per group.
+            file_size = group_data['size']
+            size_str = format_file_size(file_size)
+            space_saveable = file_size * (group_data['count'] - 1)
             total_space += space_saveable
             
             formatted_groups.append({
@@ -390,19 +404,29 @@ def duplicates_scan():
                 'files': [{
                     'path': f['path'],
                     'name': f['name'],
-                    'size': format_file_size(f['size']),
-                    'size_bytes': f['size'],
+                    'size': format_file_size(file_info.size),
+                    'size_bytes': file_size,
                     'modified': f['modified'].strftime('%Y-%m-%d %H:%M:%S')
                 } for f in group_data['files']],
                 'space_saveable': format_file_size(space_saveable)
             })
         
-        return jsonify({
+        payload = {
             'success': True,
             'groups': formatted_groups,
             'total_groups': len(formatted_groups),
             'total_space_saveable': format_file_size(total_space)
-        })
+        }
+        
+        # Large scans produce big payloads - orjson serializes them natively.
+        # It rejects names that aren't valid UTF-8 (surrogate-escaped bytes
+        # on Linux), which jsonify escapes instead.
+        if ORJSON_AVAILABLE:
+            try:
+                return Response(orjson.dumps(payload), mimetype='application/json')
+            except TypeError:
+                pass
+        return jsonify(payload)
     
     except Exception as e:
         logger.error(f"Duplicate scan error: {e}")
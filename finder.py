@@ -8,37 +8,180 @@ content hashing.
 import os
 import hashlib
 import shutil
-from pathlib import Path
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, Iterator, List, Optional, Tuple
 import logging
+from utils import invalidate_path, validate_and_canonicalize
 
+try:
+    from blake3 import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
 
-def calculate_file_hash(file_path: str) -> str:
-    """Calculate MD5 hash of file content."""
+# Files smaller than this are not considered duplicates
+MIN_DUPLICATE_SIZE = 100
+
+# Read size for hashing; large blocks keep the SIMD hash loops saturated
+HASH_BLOCK_SIZE = 1024 * 1024
+
+# Pairs of same-size files are compared directly in blocks of this size
+COMPARE_BLOCK_SIZE = 64 * 1024
+
+# Same-size files are first compared by a cheap fingerprint: the first
+# 4 KiB for small files, three 64 KiB samples for large ones
+HEAD_SIZE = 4096
+SAMPLE_SIZE = 64 * 1024
+SAMPLE_THRESHOLD = 3 * SAMPLE_SIZE
+
+# Hashing releases the GIL, so candidates are hashed on a thread pool
+HASH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+
+# Hashes are memoized by (path, inode, size, mtime, ctime) so rescans of
+# an unchanged tree skip re-reading files; a modified file gets a new key
+HashCacheKey = Tuple[str, int, int, int, int]
+_HASH_CACHE: Dict[HashCacheKey, str] = {}
+HASH_CACHE_MAX_ENTRIES = 100000
+
+
+def _new_hasher():
+    """Return a fresh content hasher (BLAKE3, or SHA-256 as fallback)."""
+    if BLAKE3_AVAILABLE:
+        return blake3()
+    # OpenSSL dispatches SHA-256 to the SHA-NI instructions where available
+    return hashlib.new('sha256')
+
+
+def _update_from_file(hasher, f) -> None:
+    """Feed an open file's content to hasher in chunks.
+    
+    Plain reads are used rather than mmap: a file truncated while being
+    hashed (an active download, a rotated log) just yields short data,
+    where touching a mapped page past the new end would kill the process
+    with SIGBUS.
+    """
+    # Ask the kernel for aggressive readahead, since the whole file is
+    # read front to back (not available on Windows)
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    
+    # Read into a single reusable buffer
+    buffer = bytearray(HASH_BLOCK_SIZE)
+    with memoryview(buffer) as view:
+        while n := f.readinto(buffer):
+            hasher.update(view[:n])
+
+
+def _hash_cache_key(file_path: str, stat: os.stat_result) -> HashCacheKey:
+    """Build the _HASH_CACHE key identifying one version of a file."""
+    # mtime alone can be restored after a rewrite (cp -p, rsync -t, touch -r)
+    # or be too coarse (FAT), but utime cannot roll back ctime, and a
+    # replaced file gets a new inode
+    return (os.path.abspath(file_path), stat.st_ino, stat.st_size,
+            stat.st_mtime_ns, stat.st_ctime_ns)
+
+
+def _cache_hash(cache_key: HashCacheKey, file_hash: str) -> None:
+    """Store a hash in _HASH_CACHE, clearing it when full."""
+    if len(_HASH_CACHE) >= HASH_CACHE_MAX_ENTRIES:
+        _HASH_CACHE.clear()
+    _HASH_CACHE[cache_key] = file_hash
+
+
+def calculate_file_hash(file_path: str, stat: Optional[os.stat_result] = None) -> str:
+    """Calculate content hash of a file (BLAKE3 or SHA-256)."""
+    hasher = _new_hasher()
+    
+    try:
+        if stat is None:
+            stat = os.stat(file_path)
+        cache_key = _hash_cache_key(file_path, stat)
+        cached = _HASH_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+        
+        with open(file_path, 'rb', buffering=0) as f:
+            _update_from_file(hasher, f)
+        file_hash = hasher.hexdigest()
+        
+        _cache_hash(cache_key, file_hash)
+        return file_hash
+    except Exception as e:
+        logger = logging.getLogger('file_management_system')
+        logger.error(f"Failed to hash {file_path}: {e}")
+        return ""
+
+
+def _sampled_fingerprint(file_path: str, file_size: int) -> bytes:
+    """Fingerprint a file from its head, or its first, middle and last 64 KiB."""
     hash_md5 = hashlib.md5()
     
     try:
         with open(file_path, 'rb') as f:
-            # Read in chunks for memory efficiency
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_md5.update(chunk)
-        return hash_md5.hexdigest()
+            if file_size <= SAMPLE_THRESHOLD:
+                hash_md5.update(f.read(HEAD_SIZE))
+            else:
+                for offset in (0, (file_size - SAMPLE_SIZE) // 2, file_size - SAMPLE_SIZE):
+                    f.seek(offset)
+                    hash_md5.update(f.read(SAMPLE_SIZE))
+        return hash_md5.digest()
     except Exception as e:
         logger = logging.getLogger('file_management_system')
-        logger.error(f"Failed to hash {file_path}: {e}")
+        logger.error(f"Failed to fingerprint {file_path}: {e}")
+        return b""
+
+
+def _hash_if_identical(entry_a: Tuple[str, os.stat_result],
+                       entry_b: Tuple[str, os.stat_result]) -> str:
+    """
+    Compare two same-size files block by block, hashing as it goes.
+    
+    Returns the shared content hash if the files are identical, or ""
+    as soon as a block differs, so non-duplicates are rarely read fully.
+    """
+    key_a = _hash_cache_key(*entry_a)
+    key_b = _hash_cache_key(*entry_b)
+    cached_a = _HASH_CACHE.get(key_a)
+    cached_b = _HASH_CACHE.get(key_b)
+    if cached_a is not None and cached_b is not None:
+        return cached_a if cached_a == cached_b else ""
+    
+    hasher = _new_hasher()
+    buffer_a = bytearray(COMPARE_BLOCK_SIZE)
+    buffer_b = bytearray(COMPARE_BLOCK_SIZE)
+    
+    try:
+        with open(entry_a[0], 'rb') as fa, open(entry_b[0], 'rb') as fb, \
+                memoryview(buffer_a) as view_a, memoryview(buffer_b) as view_b:
+            while n := fa.readinto(buffer_a):
+                if fb.readinto(buffer_b) != n or view_a[:n] != view_b[:n]:
+                    return ""
+                hasher.update(view_a[:n])
+        file_hash = hasher.hexdigest()
+    except Exception as e:
+        logger = logging.getLogger('file_management_system')
+        logger.error(f"Failed to compare {entry_a[0]} and {entry_b[0]}: {e}")
         return ""
+    
+    _cache_hash(key_a, file_hash)
+    _cache_hash(key_b, file_hash)
+    return file_hash
 
 
-def get_file_info(file_path: str) -> Dict:
-    """Get file metadata (size, date, path)."""
+def get_file_info(file_path: str, stat: Optional[os.stat_result] = None) -> Dict:
+    """Get file metadata (size, date, path), reusing stat if given."""
     try:
-        path_obj = Path(file_path)
-        stat = path_obj.stat()
+        if stat is None:
+            stat = os.stat(file_path)
         
         return {
-            'path': str(path_obj.resolve()),
-            'name': path_obj.name,
+            'path': os.path.abspath(file_path),
+            'name': os.path.basename(file_path),
             'size': stat.st_size,
             'modified': datetime.fromtimestamp(stat.st_mtime)
         }
@@ -48,82 +191,104 @@ def get_file_info(file_path: str) -> Dict:
         return None
 
 
-def scan_for_duplicates(directory: str, recursive: bool = True) -> Dict:
-    """Scan directory and group duplicate files by hash."""
-    from utils import validate_path
-    
+def _iter_files(directory: str, recursive: bool = True) -> Iterator[Tuple[str, os.stat_result]]:
+    """Yield (path, stat) for regular files using os.scandir."""
     logger = logging.getLogger('file_management_system')
+    pending = [directory]
     
-    if not validate_path(directory):
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file(follow_symlinks=False):
+                            yield entry.path, entry.stat(follow_symlinks=False)
+                        elif recursive and entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                    except OSError as e:
+                        logger.warning(f"Error processing {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Cannot scan directory {current}: {e}")
+
+
+def scan_for_duplicates(directory: str, recursive: bool = True) -> Dict:
+    """Scan directory and group duplicate files by hash."""
+    root = validate_and_canonicalize(directory)
+    if root is None:
         raise ValueError(f"Invalid or inaccessible path: {directory}")
     
     # Dictionary to store hash -> list of files
     hash_map = {}
-    path_obj = Path(directory).resolve()
-    
-    # Get all files
-    if recursive:
-        files = path_obj.rglob('*')
-    else:
-        files = path_obj.glob('*')
     
     # First pass: Group files by size (faster pre-filter)
-    size_map = {}
+    size_map = defaultdict(list)
     
-    for file_path in files:
-        if file_path.is_file():
-            try:
-                stat = file_path.stat()
-                file_size = stat.st_size
-                
-                # Skip empty files (they're not useful duplicates)
-                if file_size == 0:
-                    continue
-                
-                # Skip very small files (< 100 bytes) - likely not real duplicates
-                if file_size < 100:
-                    continue
-                
-                if file_size not in size_map:
-                    size_map[file_size] = []
-                
-                size_map[file_size].append(str(file_path))
-            
-            except Exception as e:
-                logger.warning(f"Error processing {file_path}: {e}")
-                continue
-    
-    # Second pass: Only hash files that have the same size (potential duplicates)
-    for file_size, file_paths in size_map.items():
-        # Only hash if there are multiple files with the same size
-        if len(file_paths) > 1:
-            for file_path in file_paths:
-                try:
-                    file_hash = calculate_file_hash(file_path)
-                    
-                    if file_hash:
-                        if file_hash not in hash_map:
-                            hash_map[file_hash] = []
-                        
-                        file_info = get_file_info(file_path)
-                        if file_info:
-                            hash_map[file_hash].append(file_info)
+    # Entries are (path, stat) so later passes never stat a file again
+    for file_path, stat in _iter_files(root, recursive):
+        # Skip empty and very small files (< 100 bytes) - likely not real duplicates
+        if stat.st_size >= MIN_DUPLICATE_SIZE:
+            size_map[stat.st_size].append((file_path, stat))
+    
+    # Second pass: Only keep files that share a size (potential duplicates)
+    # and a fingerprint, so most non-duplicates are never fully read
+    candidate_groups = []
+    
+    for file_size, file_entries in size_map.items():
+        if len(file_entries) < 2:
+            continue
+        
+        fingerprint_map = {}
+        for file_entry in file_entries:
+            fingerprint = _sampled_fingerprint(file_entry[0], file_size)
+            if fingerprint:
+                if fingerprint not in fingerprint_map:
+                    fingerprint_map[fingerprint] = []
+                fingerprint_map[fingerprint].append(file_entry)
+        
+        for matching_entries in fingerprint_map.values():
+            if len(matching_entries) > 1:
+                candidate_groups.append(matching_entries)
+    
+    # Third pass: Hash the full content of the remaining candidates in
+    # parallel; results are collected here so hash_map needs no locking.
+    # Pairs are compared directly, stopping at the first differing block.
+    with ThreadPoolExecutor(max_workers=HASH_WORKERS) as executor:
+        jobs = []
+        for group in candidate_groups:
+            if len(group) == 2:
+                jobs.append((group, executor.submit(_hash_if_identical, *group)))
+            else:
+                for file_entry in group:
+                    jobs.append(([file_entry], executor.submit(calculate_file_hash, *file_entry)))
+        
+        for file_entries, future in jobs:
+            file_hash = future.result()
+            if file_hash:
+                if file_hash not in hash_map:
+                    hash_map[file_hash] = []
                 
-                except Exception as e:
-                    logger.warning(f"Error hashing {file_path}: {e}")
-                    continue
+                hash_map[file_hash].extend(file_entries)
     
-    # Filter to only duplicates (hash with more than one file)
+    # Filter to only duplicates (hash with more than one file). File
+    # records are only built here, so unique files never get one.
     duplicate_groups = {}
     
-    for file_hash, files in hash_map.items():
+    for file_hash, file_entries in hash_map.items():
+        if len(file_entries) < 2:
+            continue
+        
+        files = [info for info in (get_file_info(path, stat) for path, stat in file_entries)
+                 if info]
         if len(files) > 1:
-            total_size = sum(f['size'] for f in files)
+            # Identical content means every file in the group has one size
+            file_size = files[0]['size']
             duplicate_groups[file_hash] = {
                 'hash': file_hash,
                 'files': files,
                 'count': len(files),
-                'total_size': total_size
+                'size': file_size,
+                'total_size': file_size * len(files)
             }
     
     return duplicate_groups
@@ -156,11 +321,11 @@ def remove_duplicates(duplicate_groups: Dict, keep_indices: List) -> Dict:
             try:
                 if idx not in keep_indices:
                     # Remove this file
-                    file_path = Path(file_info['path'])
-                    if file_path.exists():
+                    file_path = file_info['path']
+                    if os.path.exists(file_path):
                         # Ensure file_size is an integer
                         file_size = int(file_info.get('size_bytes', file_info.get('size', 0)))
-                        file_path.unlink()
+                        os.unlink(file_path)
                         result['summary']['removed'] += 1
                         result['summary']['space_saved'] += file_size
                         logger.info(f"Removed duplicate: {file_path}")
@@ -195,8 +360,14 @@ def archive_duplicates(duplicate_groups: Dict, archive_dir: str) -> Dict:
     }
     
     # Create archive directory
-    archive_path = Path(archive_dir)
-    archive_path.mkdir(parents=True, exist_ok=True)
+    os.makedirs(archive_dir, exist_ok=True)
+    invalidate_path(archive_dir)
+    
+    # Names already taken in the archive, listed once up front. Compared
+    # case-insensitively so names differing only in case never collide on
+    # Windows/macOS. next_counter lets repeated names resume numbering.
+    existing = {name.casefold() for name in os.listdir(archive_dir)}
+    next_counter = {}
     
     for group_hash, group_data in duplicate_groups.items():
         files = group_data['files']
@@ -205,24 +376,27 @@ def archive_duplicates(duplicate_groups: Dict, archive_dir: str) -> Dict:
         for idx, file_info in enumerate(files):
             try:
                 if idx > 0:  # Archive all except first
-                    source = Path(file_info['path'])
+                    source = file_info['path']
                     
-                    if source.exists():
+                    if os.path.exists(source):
                         # Create unique filename in archive
-                        dest_name = source.name
-                        dest = archive_path / dest_name
+                        dest_name = os.path.basename(source)
+                        name_key = dest_name.casefold()
                         
                         # Ensure unique name in archive
-                        counter = 1
-                        while dest.exists():
-                            stem = source.stem
-                            suffix = source.suffix
+                        if name_key in existing:
+                            stem, suffix = os.path.splitext(dest_name)
+                            counter = next_counter.get(name_key, 1)
+                            while f"{stem}_{counter}{suffix}".casefold() in existing:
+                                counter += 1
+                            next_counter[name_key] = counter + 1
                             dest_name = f"{stem}_{counter}{suffix}"
-                            dest = archive_path / dest_name
-                            counter += 1
+                        
+                        dest = os.path.join(archive_dir, dest_name)
                         
                         # Move file
-                        shutil.move(str(source), str(dest))
+                        shutil.move(source, dest)
+                        existing.add(dest_name.casefold())
                         result['summary']['archived'] += 1
                         # Ensure size is an integer
                         file_size = int(file_info.get('size_bytes', file_info.get('size', 0)))
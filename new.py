@@ -11,12 +11,12 @@ print(f"Path validation: {validate_path(test_dir)}")
 
 # Test scanning
 try:
-    files = scan_directory(test_dir)
+    files = list(scan_directory(test_dir))
     print(f"\nFound {len(files)} files")
     if files:
         print("\nFirst 3 files:")
         for f in files[:3]:
-            print(f"  - {f['name']} ({f['category']}, {f['size']} bytes)")
+            print(f"  - {f.name} ({f.category}, {f.size} bytes)")
 except Exception as e:
     print(f"Error scanning: {e}")
 
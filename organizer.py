@@ -7,11 +7,16 @@ safely while preserving metadata.
 """
 
 import os
+import re
+import errno
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Optional
-from utils import validate_path, setup_logging, log_operation
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from utils import (validate_path, validate_and_canonicalize, invalidate_path,
+                   setup_logging, log_operation)
 
 # Initialize logger
 logger = setup_logging()
@@ -30,55 +35,105 @@ CATEGORY_MAPPINGS = {
                  '.iso'],
 }
 
+# Flattened extension -> category lookup built from CATEGORY_MAPPINGS
+_EXT_TO_CATEGORY = {
+    extension: category
+    for category, extensions in CATEGORY_MAPPINGS.items()
+    for extension in extensions
+}
+
+
+# Directories never descended into by a recursive scan (hidden directories,
+# i.e. names starting with '.', are skipped as well)
+IGNORED_DIRS = {'node_modules', '__pycache__', 'venv', '$RECYCLE.BIN',
+                'System Volume Information'}
+
+# Width of the mtime buckets organize_by_date caches date folders by
+DATE_BUCKET_SECONDS = 900
+
+# Rule sets larger than this are matched by organize_by_project with one
+# compiled regex instead of a substring check per rule
+RULE_REGEX_THRESHOLD = 8
+
+# Concurrent file moves when executing an organization; lower it for
+# slow or high-latency (network) filesystems via max_workers
+MOVE_WORKERS = 8
+
+
+@dataclass(slots=True)
+class FileInfo:
+    """Metadata for one scanned file; mtime is seconds since the epoch."""
+    path: str
+    name: str
+    extension: str
+    size: int
+    mtime: float
+    category: str
+
 
-def scan_directory(path: str) -> List[Dict]:
+def _make_file_info(file_path: str, name: str, stat: os.stat_result) -> FileInfo:
+    """Build the FileInfo record for one scanned file."""
+    extension = os.path.splitext(name)[1].lower()
+    return FileInfo(file_path, name, extension, stat.st_size, stat.st_mtime,
+                    get_file_category(extension))
+
+
+def scan_directory(path: str, recursive: bool = False) -> Iterator[FileInfo]:
     """
-    Scan directory and return list of files with metadata.
+    Scan directory and yield files with metadata.
     
-    This function recursively scans a directory and collects information
-    about all files found, including their paths, sizes, and timestamps.
+    This function scans a directory (and optionally its subdirectories)
+    and yields information about each file found, including its path,
+    size, and modification time. Results are streamed, so even very
+    large directories are processed in bounded memory.
     
     Args:
         path: Directory path to scan
+        recursive: Whether to include files in subdirectories, skipping
+            hidden directories and those listed in IGNORED_DIRS
         
-    Returns:
-        List of dictionaries containing file information
+    Yields:
+        FileInfo records describing each file found
         
     Example:
-        >>> files = scan_directory("/home/user/downloads")
+        >>> files = list(scan_directory("/home/user/downloads"))
         >>> len(files)
         42
     """
-    if not validate_path(path):
+    path_str = validate_and_canonicalize(path)
+    if path_str is None:
         logger.error(f"Invalid path provided: {path}")
-        return []
-    
-    files = []
-    path_obj = Path(path).resolve()
-    
-    try:
-        for item in path_obj.iterdir():
-            if item.is_file():
-                try:
-                    stat = item.stat()
-                    file_info = {
-                        'path': str(item),
-                        'name': item.name,
-                        'extension': item.suffix.lower(),
-                        'size': stat.st_size,
-                        'modified': datetime.fromtimestamp(stat.st_mtime),
-                        'category': get_file_category(item.suffix.lower())
-                    }
-                    files.append(file_info)
-                except (OSError, PermissionError) as e:
-                    logger.warning(f"Cannot access file {item}: {e}")
-                    continue
-    
-    except (OSError, PermissionError) as e:
-        logger.error(f"Cannot scan directory {path}: {e}")
-        return []
-    
-    return files
+        return
+    
+    # os.scandir gives file type and stat info from the directory listing
+    # itself, so no path joins or separate lstat calls are needed per file.
+    # Subdirectories (when recursive) are walked depth-first from a stack.
+    pending = [path_str]
+    while pending:
+        current = pending.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            # Ignored directories are never descended into
+                            if (recursive and not entry.name.startswith('.')
+                                    and entry.name not in IGNORED_DIRS):
+                                pending.append(entry.path)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                    except (OSError, PermissionError) as e:
+                        logger.warning(f"Cannot access file {entry.path}: {e}")
+                        continue
+                    yield _make_file_info(entry.path, entry.name, stat)
+        
+        except (OSError, PermissionError) as e:
+            if current == path_str:
+                logger.error(f"Cannot scan directory {path}: {e}")
+            else:
+                logger.warning(f"Cannot scan directory {current}: {e}")
 
 
 def get_file_category(extension: str) -> str:
@@ -97,17 +152,28 @@ def get_file_category(extension: str) -> str:
         >>> get_file_category('.unknown')
         'Others'
     """
-    extension = extension.lower()
-    
-    for category, extensions in CATEGORY_MAPPINGS.items():
-        if extension in extensions:
-            return category
-    
-    return 'Others'
+    return _EXT_TO_CATEGORY.get(extension.lower(), 'Others')
+
 
 
+def _replace_or_copy(source: str, destination: str, preserve_metadata: bool) -> None:
+    """Rename source onto destination, copying across filesystems."""
+    try:
+        # Same-filesystem moves are a single atomic rename, which keeps
+        # the file's timestamps untouched
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        
+        # Cross-device move - copy and delete via shutil.move; copy2
+        # carries the timestamps over as part of the copy
+        copy_function = shutil.copy2 if preserve_metadata else shutil.copy
+        shutil.move(source, destination, copy_function=copy_function)
 
-def move_file_safely(source: str, destination: str, preserve_metadata: bool = True) -> bool:
+
+def move_file_safely(source: str, destination: str, preserve_metadata: bool = True,
+                     skip_mkdir: bool = False) -> bool:
     """
     Move file with error handling and metadata preservation.
     
@@ -118,6 +184,8 @@ def move_file_safely(source: str, destination: str, preserve_metadata: bool = Tr
         source: Source file path
         destination: Destination file path
         preserve_metadata: Whether to preserve file timestamps
+        skip_mkdir: Skip creating the destination directory (for callers
+            that already created it)
         
     Returns:
         bool: True if successful, False otherwise
@@ -127,39 +195,89 @@ def move_file_safely(source: str, destination: str, preserve_metadata: bool = Tr
         True
     """
     try:
-        source_path = Path(source)
-        dest_path = Path(destination)
-        
-        # Ensure source exists
-        if not source_path.exists():
-            logger.error(f"Source file does not exist: {source}")
-            return False
-        
-        # Create destination directory if needed
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        # Get original timestamps before moving
-        if preserve_metadata:
-            stat = source_path.stat()
-            atime = stat.st_atime
-            mtime = stat.st_mtime
-        
-        # Move the file
-        shutil.move(str(source_path), str(dest_path))
-        
-        # Restore timestamps
-        if preserve_metadata:
-            os.utime(str(dest_path), (atime, mtime))
+        try:
+            _replace_or_copy(source, destination, preserve_metadata)
+        except FileNotFoundError:
+            # Only create the destination directory once we know the
+            # source is there, so a missing source leaves nothing behind
+            if skip_mkdir or not os.path.exists(source):
+                raise
+            Path(destination).parent.mkdir(parents=True, exist_ok=True)
+            _replace_or_copy(source, destination, preserve_metadata)
         
         logger.info(f"Successfully moved: {source} -> {destination}")
         return True
     
     except (OSError, PermissionError, shutil.Error) as e:
-        logger.error(f"Failed to move {source} to {destination}: {e}")
+        if isinstance(e, FileNotFoundError) and not os.path.exists(source):
+            logger.error(f"Source file does not exist: {source}")
+        else:
+            logger.error(f"Failed to move {source} to {destination}: {e}")
         return False
 
 
-def organize_by_type(files: List[Dict], target_dir: str, preview: bool = False) -> Dict:
+def _execute_moves(moves: List[Tuple[str, str, str]], result: Dict,
+                   max_workers: int = MOVE_WORKERS) -> None:
+    """
+    Move planned files, creating each destination directory only once.
+    
+    Moves are I/O-bound, so they run on a small thread pool to overlap
+    filesystem latency; results are tallied in the calling thread.
+    
+    Args:
+        moves: List of (source, destination, filename) tuples
+        result: Operation result dictionary to update
+        max_workers: Number of concurrent moves (1 moves serially)
+    """
+    for directory in {os.path.dirname(destination) for _, destination, _ in moves}:
+        try:
+            os.makedirs(directory, exist_ok=True)
+            invalidate_path(directory)
+        except OSError as e:
+            # Moves into this directory will fail and be reported below
+            logger.error(f"Cannot create directory {directory}: {e}")
+    
+    def move(planned_move: Tuple[str, str, str]) -> bool:
+        source, destination, _ = planned_move
+        return move_file_safely(source, destination, skip_mkdir=True)
+    
+    if max_workers > 1 and len(moves) > 1:
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(moves))) as executor:
+            outcomes = list(executor.map(move, moves))
+    else:
+        outcomes = [move(planned_move) for planned_move in moves]
+    
+    for (_, _, filename), moved in zip(moves, outcomes):
+        if moved:
+            result['processed'] += 1
+        else:
+            result['errors'].append(f"Failed to move: {filename}")
+
+
+def _compile_rules(rules: Dict) -> Tuple[re.Pattern, List[str]]:
+    """
+    Compile project rules into a single regex for organize_by_project.
+    
+    Each pattern becomes a lookahead alternative named r<index>. The
+    alternatives are tried in rule order, so the first rule whose pattern
+    appears anywhere in the lowercased filename wins, the same as checking
+    the rules one at a time.
+    
+    Args:
+        rules: Dictionary mapping patterns to project folder names
+        
+    Returns:
+        Tuple of the compiled regex and the project names by rule index
+    """
+    alternatives = [
+        f"(?=.*?(?P<r{index}>{re.escape(pattern.lower())}))"
+        for index, pattern in enumerate(rules)
+    ]
+    return re.compile('|'.join(alternatives), re.DOTALL), list(rules.values())
+
+
+def organize_by_type(files: Iterable[FileInfo], target_dir: str, preview: bool = False,
+                     max_workers: int = MOVE_WORKERS) -> Dict:
     """
     Organize files into folders by extension type.
     
@@ -167,9 +285,10 @@ def organize_by_type(files: List[Dict], target_dir: str, preview: bool = False)
     folders (Documents, Images, Videos, etc.).
     
     Args:
-        files: List of file information dictionaries
+        files: Iterable of FileInfo records (e.g. from scan_directory)
         target_dir: Base directory for organized files
         preview: If True, only simulate without moving files
+        max_workers: Number of files moved concurrently
         
     Returns:
         Dictionary with operation results
@@ -193,32 +312,29 @@ def organize_by_type(files: List[Dict], target_dir: str, preview: bool = False)
     
     # Group files by category
     category_counts = {}
+    moves = []
     
     for file_info in files:
-        category = file_info['category']
-        source = file_info['path']
-        filename = file_info['name']
+        category = file_info.category
+        filename = file_info.name
         
         # Build destination path
-        category_dir = Path(target_dir) / category
-        destination = category_dir / filename
+        destination = os.path.join(target_dir, category, filename)
+        moves.append((file_info.path, destination, filename))
         
         # Track category counts
         category_counts[category] = category_counts.get(category, 0) + 1
-        
-        if preview:
-            # Preview mode - don't actually move files
-            result['processed'] += 1
-        else:
-            # Execute mode - move files
-            if move_file_safely(source, str(destination)):
-                result['processed'] += 1
-            else:
-                result['errors'].append(f"Failed to move: {filename}")
+    
+    if preview:
+        # Preview mode - don't actually move files
+        result['processed'] = len(moves)
+    else:
+        # Execute mode - move files
+        _execute_moves(moves, result, max_workers)
     
     result['summary'] = {
         'by_category': category_counts,
-        'total_files': len(files)
+        'total_files': len(moves)
     }
     
     log_operation('organize_by_type', {
@@ -230,7 +346,8 @@ def organize_by_type(files: List[Dict], target_dir: str, preview: bool = False)
     return result
 
 
-def organize_by_date(files: List[Dict], target_dir: str, preview: bool = False) -> Dict:
+def organize_by_date(files: Iterable[FileInfo], target_dir: str, preview: bool = False,
+                     max_workers: int = MOVE_WORKERS) -> Dict:
     """
     Organize files into folders by modification date.
     
@@ -238,9 +355,10 @@ def organize_by_date(files: List[Dict], target_dir: str, preview: bool = False)
     files based on their modification timestamps.
     
     Args:
-        files: List of file information dictionaries
+        files: Iterable of FileInfo records (e.g. from scan_directory)
         target_dir: Base directory for organized files
         preview: If True, only simulate without moving files
+        max_workers: Number of files moved concurrently
         
     Returns:
         Dictionary with operation results
@@ -264,35 +382,38 @@ def organize_by_date(files: List[Dict], target_dir: str, preview: bool = False)
     
     # Group files by date
     date_counts = {}
+    date_folders = {}
+    moves = []
     
     for file_info in files:
-        source = file_info['path']
-        filename = file_info['name']
-        modified_date = file_info['modified']
+        filename = file_info.name
         
-        # Format date as YYYY-MM-DD
-        date_folder = modified_date.strftime('%Y-%m-%d')
+        # Format date as YYYY-MM-DD, once per time bucket. Local UTC offsets
+        # (and DST switches) fall on 15-minute boundaries, so every
+        # timestamp in a bucket maps to the same local date.
+        bucket = int(file_info.mtime // DATE_BUCKET_SECONDS)
+        date_folder = date_folders.get(bucket)
+        if date_folder is None:
+            date_folder = datetime.fromtimestamp(file_info.mtime).strftime('%Y-%m-%d')
+            date_folders[bucket] = date_folder
         
         # Build destination path
-        date_dir = Path(target_dir) / date_folder
-        destination = date_dir / filename
+        destination = os.path.join(target_dir, date_folder, filename)
+        moves.append((file_info.path, destination, filename))
         
         # Track date counts
         date_counts[date_folder] = date_counts.get(date_folder, 0) + 1
-        
-        if preview:
-            # Preview mode - don't actually move files
-            result['processed'] += 1
-        else:
-            # Execute mode - move files
-            if move_file_safely(source, str(destination)):
-                result['processed'] += 1
-            else:
-                result['errors'].append(f"Failed to move: {filename}")
+    
+    if preview:
+        # Preview mode - don't actually move files
+        result['processed'] = len(moves)
+    else:
+        # Execute mode - move files
+        _execute_moves(moves, result, max_workers)
     
     result['summary'] = {
         'by_date': date_counts,
-        'total_files': len(files)
+        'total_files': len(moves)
     }
     
     log_operation('organize_by_date', {
@@ -304,8 +425,8 @@ def organize_by_date(files: List[Dict], target_dir: str, preview: bool = False)
     return result
 
 
-def organize_by_project(files: List[Dict], rules: Dict, target_dir: str, 
-                       preview: bool = False) -> Dict:
+def organize_by_project(files: Iterable[FileInfo], rules: Dict, target_dir: str, 
+                       preview: bool = False, max_workers: int = MOVE_WORKERS) -> Dict:
     """
     Organize files based on custom project rules.
     
@@ -313,10 +434,11 @@ def organize_by_project(files: List[Dict], rules: Dict, target_dir: str,
     project-specific folders based on filename patterns or extensions.
     
     Args:
-        files: List of file information dictionaries
+        files: Iterable of FileInfo records (e.g. from scan_directory)
         rules: Dictionary mapping patterns to project folder names
         target_dir: Base directory for organized files
         preview: If True, only simulate without moving files
+        max_workers: Number of files moved concurrently
         
     Returns:
         Dictionary with operation results
@@ -345,51 +467,53 @@ def organize_by_project(files: List[Dict], rules: Dict, target_dir: str,
     # Group files by project
     project_counts = {}
     unmatched_count = 0
+    # Small rule sets are cheapest as plain substring checks against
+    # patterns lowered once up front; larger ones use a single regex
+    if len(rules) <= RULE_REGEX_THRESHOLD:
+        lowered_rules = [(pattern.lower(), project) for pattern, project in rules.items()]
+        rule_regex = None
+    else:
+        rule_regex, rule_projects = _compile_rules(rules)
+    moves = []
     
     for file_info in files:
-        source = file_info['path']
-        filename = file_info['name']
+        filename = file_info.name
         
-        # Find matching rule
+        # Find matching rule (first rule in order whose pattern appears)
         matched_project = None
-        for pattern, project_name in rules.items():
-            if pattern.lower() in filename.lower():
-                matched_project = project_name
-                break
+        filename_lower = filename.lower()
+        if rule_regex is None:
+            for pattern, project in lowered_rules:
+                if pattern in filename_lower:
+                    matched_project = project
+                    break
+        else:
+            match = rule_regex.match(filename_lower)
+            if match:
+                matched_project = rule_projects[int(match.lastgroup[1:])]
         
         if matched_project:
             # Build destination path
-            project_dir = Path(target_dir) / matched_project
-            destination = project_dir / filename
+            destination = os.path.join(target_dir, matched_project, filename)
             
             # Track project counts
             project_counts[matched_project] = project_counts.get(matched_project, 0) + 1
-            
-            if preview:
-                result['processed'] += 1
-            else:
-                if move_file_safely(source, str(destination)):
-                    result['processed'] += 1
-                else:
-                    result['errors'].append(f"Failed to move: {filename}")
         else:
             # No matching rule - move to "Unmatched" folder
-            unmatched_dir = Path(target_dir) / "Unmatched"
-            destination = unmatched_dir / filename
+            destination = os.path.join(target_dir, "Unmatched", filename)
             unmatched_count += 1
-            
-            if preview:
-                result['processed'] += 1
-            else:
-                if move_file_safely(source, str(destination)):
-                    result['processed'] += 1
-                else:
-                    result['errors'].append(f"Failed to move: {filename}")
+        
+        moves.append((file_info.path, destination, filename))
+    
+    if preview:
+        result['processed'] = len(moves)
+    else:
+        _execute_moves(moves, result, max_workers)
     
     result['summary'] = {
         'by_project': project_counts,
         'unmatched': unmatched_count,
-        'total_files': len(files)
+        'total_files': len(moves)
     }
     
     log_operation('organize_by_project', {
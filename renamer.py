@@ -6,35 +6,128 @@ descriptive filenames.
 """
 
 import os
+import re
+import json
+import shutil
+import string
+import hashlib
+import tempfile
+import threading
+from itertools import islice
+from importlib.util import find_spec
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from typing import List, Dict
 import logging
 
-try:
-    import pytesseract
-    from PIL import Image, ImageEnhance, ImageFilter
-    TESSERACT_AVAILABLE = True
-    
-    # Configure Tesseract path for Windows
-    # Update this path if Tesseract is installed elsewhere
-    pytesseract.pytesseract.tesseract_cmd = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
-except ImportError:
-    TESSERACT_AVAILABLE = False
+# OCR backends are imported on first use rather than at module import:
+# easyocr pulls in torch, which costs seconds and hundreds of MB even for
+# callers that never rename a screenshot. None means "not checked yet".
+TESSERACT_AVAILABLE = None
+EASYOCR_AVAILABLE = None
+pytesseract = None
+Image = ImageEnhance = ImageFilter = None
+easyocr = None
+_easyocr_reader = None
+_easyocr_reader_failed = False
+_easyocr_gpu = None
+
+# OpenCV (optional) speeds up image preprocessing
+OPENCV_AVAILABLE = None
+cv2 = np = None
+_SMOOTH_KERNEL = None
+
+# Default Tesseract install location on Windows
+# Update this path if Tesseract is installed elsewhere
+WINDOWS_TESSERACT_CMD = r'C:\Program Files\Tesseract-OCR\tesseract.exe'
+
+
+def _ensure_tesseract() -> bool:
+    """Import pytesseract and Pillow on first use; return availability."""
+    global TESSERACT_AVAILABLE, pytesseract, Image, ImageEnhance, ImageFilter
+    if TESSERACT_AVAILABLE is None:
+        try:
+            import pytesseract as _pytesseract
+            from PIL import Image as _Image, ImageEnhance as _ImageEnhance, ImageFilter as _ImageFilter
+        except ImportError:
+            TESSERACT_AVAILABLE = False
+        else:
+            pytesseract = _pytesseract
+            Image, ImageEnhance, ImageFilter = _Image, _ImageEnhance, _ImageFilter
+            
+            # Configure Tesseract path for Windows
+            if os.name == 'nt':
+                pytesseract.pytesseract.tesseract_cmd = WINDOWS_TESSERACT_CMD
+            TESSERACT_AVAILABLE = True
+    return TESSERACT_AVAILABLE
+
+
+def _ensure_easyocr() -> bool:
+    """Import easyocr on first use; return availability."""
+    global EASYOCR_AVAILABLE, easyocr
+    if EASYOCR_AVAILABLE is None:
+        try:
+            import easyocr as _easyocr
+        except ImportError:
+            EASYOCR_AVAILABLE = False
+        else:
+            easyocr = _easyocr
+            EASYOCR_AVAILABLE = True
+    return EASYOCR_AVAILABLE
 
-try:
-    import easyocr
-    EASYOCR_AVAILABLE = True
-    # Initialize EasyOCR reader (will be lazy-loaded on first use)
-    _easyocr_reader = None
-except ImportError:
-    EASYOCR_AVAILABLE = False
-    _easyocr_reader = None
+
+def _ensure_opencv() -> bool:
+    """Import OpenCV and NumPy on first use; return availability."""
+    global OPENCV_AVAILABLE, cv2, np, _SMOOTH_KERNEL
+    if OPENCV_AVAILABLE is None:
+        try:
+            import cv2 as _cv2
+            import numpy as _np
+        except ImportError:
+            OPENCV_AVAILABLE = False
+        else:
+            cv2, np = _cv2, _np
+            # PIL's ImageFilter.SMOOTH kernel, used for sharpening
+            _SMOOTH_KERNEL = np.array([[1, 1, 1], [1, 5, 1], [1, 1, 1]], dtype=np.float32) / 13
+            OPENCV_AVAILABLE = True
+    return OPENCV_AVAILABLE
+
+
+def _preprocess_with_opencv(image):
+    """OpenCV version of preprocess_image, matching the PIL filter chain."""
+    pixels = np.asarray(image.convert('RGB'))
+    
+    # Resize if image is too small (upscale for better OCR)
+    height, width = pixels.shape[:2]
+    if width < 1000 or height < 1000:
+        scale_factor = max(1000 / width, 1000 / height)
+        new_size = (int(width * scale_factor), int(height * scale_factor))
+        pixels = cv2.resize(pixels, new_size, interpolation=cv2.INTER_LANCZOS4)
+    
+    # Enhance contrast: push pixels away from the mean grey level by 1.5x
+    mean = cv2.cvtColor(pixels, cv2.COLOR_RGB2GRAY).mean()
+    pixels = cv2.addWeighted(pixels, 1.5, pixels, 0, -0.5 * mean)
+    
+    # Enhance sharpness: extrapolate 2x away from a smoothed copy
+    smoothed = cv2.filter2D(pixels, -1, _SMOOTH_KERNEL)
+    pixels = cv2.addWeighted(pixels, 2.0, smoothed, -1.0, 0)
+    
+    # Apply slight blur to reduce noise
+    pixels = cv2.medianBlur(pixels, 3)
+    
+    return Image.fromarray(pixels)
 
 
 def preprocess_image(image):
-    """Enhance image for better OCR results."""
+    """Enhance image for better OCR results (OpenCV when installed)."""
     try:
+        # Loads Pillow's Image/ImageEnhance/ImageFilter used below
+        _ensure_tesseract()
+        
+        if _ensure_opencv():
+            return _preprocess_with_opencv(image)
+        
         # Convert to RGB if needed
         if image.mode != 'RGB':
             image = image.convert('RGB')
@@ -63,11 +156,79 @@ def preprocess_image(image):
         return image
 
 
+# Characters stripped from OCR words when building filenames
+_NON_WORD_RE = re.compile(r'[^\w]+')
+
+# Common filler words skipped when building filenames
+_SKIP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
+    'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
+    'this', 'that', 'these', 'those', 'it', 'its', 'will', 'can', 'may',
+    'has', 'have', 'had', 'do', 'does', 'did', 'not', 'no', 'yes'
+})
+
+# Maps ASCII uppercase letters to 'U' so they can be counted in one
+# translate + count pass (any other character is left as-is, and 'U'
+# itself is uppercase)
+_UPPER_TABLE = str.maketrans(dict.fromkeys(string.ascii_uppercase, 'U'))
+
+# Text-line crops sent to the EasyOCR recognizer per batch
+EASYOCR_BATCH_SIZE = 16
+
+# On-disk cache of OCR results, so re-running the renamer only OCRs new or
+# modified screenshots (cache key -> extracted text)
+OCR_CACHE_PATH = Path('~/.cache/file_mgr/ocr.json').expanduser()
+OCR_CACHE_MAX_ENTRIES = 10000
+_ocr_cache = None
+_ocr_cache_lock = threading.Lock()
+# Guards the one-time EasyOCR probes so concurrent callers never build two
+# Readers; re-entrant because get_easyocr_reader runs the GPU probe
+_easyocr_lock = threading.RLock()
+
+
+def easyocr_gpu_available() -> bool:
+    """Check whether EasyOCR can run on a CUDA GPU (probed once)."""
+    global _easyocr_gpu
+    if _easyocr_gpu is not None:
+        return _easyocr_gpu
+    with _easyocr_lock:
+        if _easyocr_gpu is None:
+            # Without easyocr or an NVIDIA driver there is no point importing
+            # torch (seconds of startup) just to find out CUDA is missing
+            if find_spec('easyocr') is None or shutil.which('nvidia-smi') is None:
+                _easyocr_gpu = False
+            elif not _ensure_easyocr():
+                _easyocr_gpu = False
+            else:
+                try:
+                    import torch
+                    _easyocr_gpu = torch.cuda.is_available()
+                except ImportError:
+                    _easyocr_gpu = False
+    return _easyocr_gpu
+
+
 def get_easyocr_reader():
-    """Lazy-load EasyOCR reader to avoid startup delay."""
-    global _easyocr_reader
-    if _easyocr_reader is None and EASYOCR_AVAILABLE:
-        _easyocr_reader = easyocr.Reader(['en'], gpu=False)
+    """Lazy-load EasyOCR reader to avoid startup delay (uses GPU if present).
+    
+    Returns None if EasyOCR is not installed or the reader cannot be
+    created (e.g. model download without network, CUDA out of memory).
+    """
+    global _easyocr_reader, _easyocr_reader_failed
+    if _easyocr_reader is not None or _easyocr_reader_failed:
+        return _easyocr_reader
+    with _easyocr_lock:
+        if _easyocr_reader is None and not _easyocr_reader_failed and _ensure_easyocr():
+            try:
+                # quantize=True applies dynamic INT8 quantization to the
+                # recognizer (its LSTM/Linear layers) when running on CPU
+                _easyocr_reader = easyocr.Reader(
+                    ['en'], gpu=easyocr_gpu_available(), quantize=True)
+            except Exception as e:
+                # Don't retry a slow failing initialization on every call
+                _easyocr_reader_failed = True
+                logging.getLogger('file_management_system').error(
+                    f"Cannot initialize EasyOCR: {e}")
     return _easyocr_reader
 
 
@@ -101,9 +262,46 @@ def extract_text_with_easyocr(image_path: str) -> str:
         return ""
 
 
+def extract_text_batch(image_paths: List[str]) -> List[str]:
+    """Extract text from several images with EasyOCR, batching recognition
+    (Tesseract is used for images EasyOCR can't handle)."""
+    logger = logging.getLogger('file_management_system')
+    
+    reader = get_easyocr_reader()
+    if reader is None:
+        return [_extract_text_with_tesseract(path) for path in image_paths]
+    
+    texts = []
+    for image_path in image_paths:
+        try:
+            # Screenshots differ in size, so detection runs per image while
+            # the detected text lines are recognized in batches
+            results = reader.readtext(
+                image_path,
+                detail=0,
+                paragraph=True,
+                batch_size=EASYOCR_BATCH_SIZE
+            )
+            text = ' '.join(results).strip()
+            logger.info(f"EasyOCR extracted {len(text)} characters from {image_path}")
+            texts.append(text)
+        except Exception as e:
+            logger.error(f"EasyOCR failed for {image_path}, falling back to Tesseract: {e}")
+            texts.append(_extract_text_with_tesseract(image_path))
+    
+    return texts
+
+
+def _extract_text_with_tesseract(image_path: str) -> str:
+    """Tesseract fallback for EasyOCR; empty text if Tesseract is missing."""
+    if not _ensure_tesseract():
+        return ""
+    return extract_text_from_image(image_path)
+
+
 def extract_text_from_image(image_path: str) -> str:
     """Use OCR to extract text from screenshot - FAST mode (Tesseract only)."""
-    if not TESSERACT_AVAILABLE:
+    if not _ensure_tesseract():
         raise ImportError("pytesseract is required for OCR functionality")
     
     logger = logging.getLogger('file_management_system')
@@ -128,10 +326,140 @@ def extract_text_from_image(image_path: str) -> str:
         return ""
 
 
+def _init_ocr_worker() -> None:
+    """Give an OCR worker process its own log handlers."""
+    from utils import setup_worker_logging
+    setup_worker_logging()
+
+
+def _run_ocr(image_paths: List[str], use_processes: bool = False) -> List[str]:
+    """Run OCR over several images in parallel, preserving input order."""
+    # EasyOCR is only fast enough on a GPU; there it takes the whole batch.
+    # If its reader can't be created, Tesseract below handles the batch.
+    if image_paths and easyocr_gpu_available() and get_easyocr_reader() is not None:
+        return extract_text_batch(image_paths)
+    
+    if len(image_paths) < 2:
+        return [extract_text_from_image(path) for path in image_paths]
+    
+    if use_processes:
+        # Worker processes sidestep the GIL entirely, at a memory cost
+        max_workers = min(len(image_paths), os.cpu_count() or 1)
+        executor = ProcessPoolExecutor(max_workers=max_workers,
+                                       initializer=_init_ocr_worker)
+    else:
+        # pytesseract runs the tesseract binary as a subprocess, so threads
+        # spend OCR time waiting outside the GIL and stay cheap on memory
+        max_workers = min(len(image_paths), 8, os.cpu_count() or 1)
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+    
+    with executor:
+        return list(executor.map(extract_text_from_image, image_paths))
+
+
+def _ocr_cache_key(image_path: str) -> str:
+    """Cache key from file size, mtime and a BLAKE2b digest of the first 64 KB."""
+    stat = os.stat(image_path)
+    with open(image_path, 'rb') as f:
+        head_digest = hashlib.blake2b(f.read(65536), digest_size=16).hexdigest()
+    return f"{stat.st_size}:{int(stat.st_mtime)}:{head_digest}"
+
+
+def _read_ocr_cache_file() -> Dict[str, str]:
+    """Read the on-disk OCR cache, returning {} if it is missing or unreadable."""
+    try:
+        with open(OCR_CACHE_PATH, encoding='utf-8') as f:
+            cached = json.load(f)
+        if isinstance(cached, dict):
+            return cached
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logging.getLogger('file_management_system').warning(
+            f"Ignoring unreadable OCR cache {OCR_CACHE_PATH}: {e}")
+    return {}
+
+
+def _load_ocr_cache() -> Dict[str, str]:
+    """Load the OCR cache from disk on first use (caller holds the lock)."""
+    global _ocr_cache
+    if _ocr_cache is None:
+        _ocr_cache = _read_ocr_cache_file()
+    return _ocr_cache
+
+
+def _save_ocr_cache() -> None:
+    """Write the OCR cache to disk, dropping the oldest entries past the limit
+    (caller holds the lock)."""
+    global _ocr_cache
+    # Other worker processes may have saved entries since this one loaded
+    # the cache; merge them in so neither overwrites the other's results
+    merged = _read_ocr_cache_file()
+    merged.update(_ocr_cache)
+    _ocr_cache = merged
+    
+    excess = len(_ocr_cache) - OCR_CACHE_MAX_ENTRIES
+    if excess > 0:
+        for key in list(islice(_ocr_cache, excess)):
+            del _ocr_cache[key]
+    
+    try:
+        OCR_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        # A unique temp file per save, so concurrent writers never share one
+        fd, temp_path = tempfile.mkstemp(dir=OCR_CACHE_PATH.parent,
+                                         prefix='ocr.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(_ocr_cache, f)
+            os.replace(temp_path, OCR_CACHE_PATH)
+        except BaseException:
+            try:
+                os.unlink(temp_path)
+            except OSError:
+                pass
+            raise
+    except OSError as e:
+        logging.getLogger('file_management_system').warning(
+            f"Could not save OCR cache {OCR_CACHE_PATH}: {e}")
+
+
+def _extract_texts(image_paths: List[str], use_processes: bool = False) -> List[str]:
+    """OCR several images, reusing cached text for files seen before."""
+    keys = []
+    for image_path in image_paths:
+        try:
+            keys.append(_ocr_cache_key(image_path))
+        except OSError:
+            keys.append(None)
+    
+    with _ocr_cache_lock:
+        cache = _load_ocr_cache()
+        texts = [cache.get(key) if key else None for key in keys]
+    
+    missing = [index for index, text in enumerate(texts) if text is None]
+    if not missing:
+        return texts
+    
+    new_texts = _run_ocr([image_paths[index] for index in missing], use_processes)
+    
+    updated = False
+    with _ocr_cache_lock:
+        cache = _load_ocr_cache()
+        for index, text in zip(missing, new_texts):
+            texts[index] = text
+            # Empty results may be transient OCR failures, so only text is kept
+            if text and keys[index]:
+                cache[keys[index]] = text
+                updated = True
+        if updated:
+            _save_ocr_cache()
+    
+    return texts
+
+
 def generate_descriptive_name(text: str, max_length: int = 60) -> str:
     """Create clean, meaningful filename from extracted text."""
     from utils import sanitize_filename
-    import re
     
     if not text or not text.strip():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -147,28 +475,24 @@ def generate_descriptive_name(text: str, max_length: int = 60) -> str:
     important_words = []  # Capitalized or long words
     regular_words = []    # Other words
     
-    # Common filler words to skip
-    skip_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 
-        'of', 'with', 'by', 'from', 'is', 'are', 'was', 'were', 'be', 'been',
-        'this', 'that', 'these', 'those', 'it', 'its', 'will', 'can', 'may',
-        'has', 'have', 'had', 'do', 'does', 'did', 'not', 'no', 'yes'
-    }
-    
     for word in words:
         # Clean the word
-        clean_word = re.sub(r'[^\w]', '', word)
+        clean_word = _NON_WORD_RE.sub('', word)
         
         # Skip if too short or only numbers
         if len(clean_word) < 2 or (clean_word.isdigit() and len(clean_word) < 4):
             continue
         
         # Skip common filler words
-        if clean_word.lower() in skip_words:
+        if clean_word.lower() in _SKIP_WORDS:
             continue
         
         # Skip words with too many uppercase (likely OCR errors like "CERTIFICATE")
-        uppercase_ratio = sum(1 for c in clean_word if c.isupper()) / len(clean_word)
+        if clean_word.isascii():
+            upper_count = clean_word.translate(_UPPER_TABLE).count('U')
+        else:
+            upper_count = sum(map(str.isupper, clean_word))
+        uppercase_ratio = upper_count / len(clean_word)
         
         # Prioritize words that are:
         # 1. Title case (first letter capital)
@@ -224,7 +548,7 @@ def generate_descriptive_name(text: str, max_length: int = 60) -> str:
     if not meaningful_words:
         # Look for any word with 4+ letters
         for word in words:
-            clean_word = re.sub(r'[^\w]', '', word)
+            clean_word = _NON_WORD_RE.sub('', word)
             if len(clean_word) >= 4 and not clean_word.isdigit():
                 meaningful_words.append(clean_word)
                 if len(meaningful_words) >= 4:
@@ -251,30 +575,30 @@ def generate_descriptive_name(text: str, max_length: int = 60) -> str:
 
 def ensure_unique_filename(directory: str, filename: str) -> str:
     """Add numeric suffix if filename exists."""
-    path = Path(directory)
-    name_stem = Path(filename).stem
-    extension = Path(filename).suffix
-    
-    # Check if file exists
-    target = path / filename
-    if not target.exists():
+    # Common case: no collision, decided by a single existence check
+    if not os.path.exists(os.path.join(directory, filename)):
         return filename
     
-    # Add numeric suffix
+    # Collision: list the directory once and pick the first free suffix in
+    # memory. Names are casefolded so case-insensitive filesystems can't
+    # report a "free" name that actually collides.
+    with os.scandir(directory) as entries:
+        existing = {entry.name.casefold() for entry in entries}
+    
+    name_stem, extension = os.path.splitext(filename)
     counter = 1
-    while True:
-        new_filename = f"{name_stem}_{counter}{extension}"
-        target = path / new_filename
-        if not target.exists():
-            return new_filename
+    while f"{name_stem}_{counter}{extension}".casefold() in existing:
         counter += 1
+    return f"{name_stem}_{counter}{extension}"
 
 
-def rename_screenshots(files: List[str], preview: bool = True) -> List[Dict]:
-    """Process screenshots and return rename proposals."""
+def rename_screenshots(files: List[str], preview: bool = True,
+                       use_processes: bool = False) -> List[Dict]:
+    """Process screenshots and return rename proposals (OCR runs in threads
+    by default, or in worker processes with use_processes=True)."""
     logger = logging.getLogger('file_management_system')
     
-    if not TESSERACT_AVAILABLE:
+    if not _ensure_tesseract():
         logger.error("Tesseract OCR is not installed")
         return [{
             'original_path': '',
@@ -287,6 +611,11 @@ def rename_screenshots(files: List[str], preview: bool = True) -> List[Dict]:
     
     results = []
     
+    # OCR every existing file up front in parallel; naming and renaming
+    # below stay serial so uniqueness checks see each previous rename
+    ocr_paths = [file_path for file_path in files if Path(file_path).exists()]
+    extracted_texts = dict(zip(ocr_paths, _extract_texts(ocr_paths, use_processes)))
+    
     for file_path in files:
         try:
             path_obj = Path(file_path)
@@ -302,8 +631,8 @@ def rename_screenshots(files: List[str], preview: bool = True) -> List[Dict]:
                 })
                 continue
             
-            # Extract text using OCR
-            extracted_text = extract_text_from_image(file_path)
+            # Text extracted by OCR above
+            extracted_text = extracted_texts.get(file_path, '')
             
             # Generate descriptive name
             new_name_stem = generate_descriptive_name(extracted_text)
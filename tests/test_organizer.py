@@ -1 +1,35 @@
-# Placeholder for organizer tests
+"""
+Tests for the file organizer module.
+"""
+
+from hypothesis import given, strategies as st
+
+from organizer import _compile_rules
+
+
+# Small alphabet so generated patterns actually occur in generated names,
+# plus regex metacharacters and case differences to exercise escaping
+_NAME_CHARS = st.sampled_from('abAB._-()[]+*?$^|\\ \n')
+
+
+def _first_matching_project(rules, filename):
+    """Reference matcher: check the rules one at a time, in order."""
+    filename_lower = filename.lower()
+    for pattern, project in rules.items():
+        if pattern.lower() in filename_lower:
+            return project
+    return None
+
+
+@given(
+    rules=st.dictionaries(st.text(_NAME_CHARS, min_size=1, max_size=4),
+                          st.text(min_size=1, max_size=8), min_size=1, max_size=20),
+    filename=st.text(_NAME_CHARS, max_size=24),
+)
+def test_compiled_rules_match_first_rule_in_order(rules, filename):
+    """The compiled regex picks the same project as the substring loop."""
+    rule_regex, rule_projects = _compile_rules(rules)
+    match = rule_regex.match(filename.lower())
+    project = rule_projects[int(match.lastgroup[1:])] if match else None
+
+    assert project == _first_matching_project(rules, filename)
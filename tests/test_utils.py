@@ -1 +1,43 @@
-# Placeholder for utility tests
+"""
+Tests for the utility module.
+"""
+
+import re
+
+from hypothesis import given, strategies as st
+
+from utils import sanitize_filename
+
+
+def _reference_sanitize(name):
+    """The original regex pipeline sanitize_filename must stay equivalent to."""
+    if not name or not isinstance(name, str):
+        return "unnamed"
+    name = name.replace(' ', '_')
+    name = re.sub(r'[^\w\-.]', '', name)
+    name = re.sub(r'_+', '_', name)
+    name = name.strip('_.')
+    return name or "unnamed"
+
+
+# Names made only of characters the fast path accepts, so many of them
+# are already clean and return through _CLEAN_RE unchanged
+_clean_names = st.text(st.sampled_from('aZ09_-.'), max_size=20)
+
+# Arbitrary ASCII, handled by the str.translate pass
+_ascii_names = st.text(st.characters(max_codepoint=127), max_size=20)
+
+# Non-ASCII names, handled by the Unicode-aware regex
+_unicode_names = st.text(max_size=20)
+
+
+@given(st.one_of(_clean_names, _ascii_names, _unicode_names))
+def test_sanitize_filename_matches_reference(name):
+    """Every path through sanitize_filename gives the original result."""
+    assert sanitize_filename(name) == _reference_sanitize(name)
+
+
+def test_sanitize_filename_rejects_non_strings():
+    """Non-string input falls back to the default name."""
+    assert sanitize_filename(None) == "unnamed"
+    assert sanitize_filename(42) == "unnamed"
@@ -8,18 +8,65 @@ and logging setup.
 
 import os
 import re
+import time
 import logging
-from pathlib import Path
+import functools
+from collections import OrderedDict
+from stat import S_ISDIR
 from typing import Optional
 
+# Application logger, looked up once rather than on every log_operation call
+_DEFAULT_LOGGER = logging.getLogger('file_management_system')
+
+# Logger returned by setup_logging once it has been configured
+_LOGGER_READY: Optional[logging.Logger] = None
+
+# Patterns used by sanitize_filename
+_BAD_CHARS = re.compile(r'[^\w\-.]')
+_MULTI_UNDERSCORE = re.compile(r'_+')
+
+# Names sanitize_filename would return unchanged: only ASCII letters,
+# digits, '_', '-' and '.', no repeated underscores, and no leading or
+# trailing '_' or '.'
+_CLEAN_RE = re.compile(r'(?![_.])(?:[A-Za-z0-9.\-]|_(?!_))+(?<![_.])')
+
+# ASCII-only equivalent of the space replacement plus _BAD_CHARS removal,
+# applied in a single str.translate pass
+_SANITIZE_TABLE = {
+    code: None
+    for code in range(128)
+    if not (chr(code).isalnum() or chr(code) in '_-.')
+}
+_SANITIZE_TABLE[ord(' ')] = '_'
+
+# Size units used by format_file_size and the divisor for each
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+_SIZE_DIVISORS = tuple(1 << (10 * index) for index in range(len(_SIZE_UNITS)))
+
+# Whitespace and quote characters trimmed from user-supplied paths
+_PATH_STRIP_CHARS = ' \t\r\n\v\f"\''
+
+# Successful validations are remembered briefly so repeated requests for
+# the same directory skip the filesystem checks (path -> expiry time).
+# Insertion-ordered so the oldest entry is dropped once the cache is full.
+_PATH_CACHE_TTL = 5.0
+_PATH_CACHE_MAX_ENTRIES = 1024
+_PATH_CACHE: 'OrderedDict[str, float]' = OrderedDict()
+
+# Failed validations are remembered for a shorter time, so a directory
+# created after a failed check is picked up quickly
+_NEG_PATH_CACHE_TTL = 2.0
+_NEG_PATH_CACHE: 'OrderedDict[str, float]' = OrderedDict()
+
 
 def validate_path(path: str) -> bool:
     """
     Validate that a directory path exists and is accessible.
     
     This function checks if the provided path exists, is a directory,
-    and has read permissions. It prevents path traversal attacks and
-    ensures the path is safe to use for file operations.
+    and has read permissions. Results are cached per path, for 5 seconds
+    when valid and 2 seconds when not, so they may briefly be stale;
+    call invalidate_path after creating or removing a directory.
     
     Args:
         path: The directory path to validate
@@ -33,35 +80,84 @@ def validate_path(path: str) -> bool:
         >>> validate_path("/nonexistent/path")
         False
     """
-    if not path or not isinstance(path, str):
+    # Strip whitespace and quotes; reject non-strings and empty paths
+    if not isinstance(path, str) or not (path := path.strip(_PATH_STRIP_CHARS)):
         return False
     
-    # Strip whitespace and quotes
-    path = path.strip().strip('"').strip("'")
-    
-    if not path:
+    now = time.monotonic()
+    if _PATH_CACHE.get(path, 0.0) > now:
+        return True
+    if _NEG_PATH_CACHE.get(path, 0.0) > now:
         return False
     
     try:
-        # Convert to Path object for safer handling
-        path_obj = Path(path).expanduser().resolve()
-        
-        # Check if path exists and is a directory
-        if not path_obj.exists():
-            return False
+        # A single stat answers both "exists" and "is a directory"; the
+        # path does not need to be canonicalized for that
+        expanded = os.path.expanduser(path)
         
-        if not path_obj.is_dir():
-            return False
+        # Check it is a directory and that we have read access
+        valid = S_ISDIR(os.stat(expanded).st_mode) and os.access(expanded, os.R_OK)
+    
+    except (OSError, ValueError) as e:
+        # Handle any path-related errors (missing, loops, embedded NULs)
+        valid = False
+    
+    if valid:
+        _remember_path(_PATH_CACHE, path, now + _PATH_CACHE_TTL)
+    else:
+        _remember_path(_NEG_PATH_CACHE, path, now + _NEG_PATH_CACHE_TTL)
+    return valid
+
+
+def validate_and_canonicalize(path: str) -> Optional[str]:
+    """
+    Validate a directory path and return its canonical form.
+    
+    Runs the same checks as validate_path. Only on success is the cleaned
+    path made absolute with symlinks resolved, for callers that need
+    the canonical location rather than a yes/no answer.
+    
+    Args:
+        path: The directory path to validate
         
-        # Check if we have read access
-        if not os.access(str(path_obj), os.R_OK):
-            return False
+    Returns:
+        str: Canonical absolute path if valid and accessible, None otherwise
         
-        return True
+    Examples:
+        >>> validate_and_canonicalize("~/documents/../downloads")
+        '/home/user/downloads'
+        >>> validate_and_canonicalize("/nonexistent/path") is None
+        True
+    """
+    if not validate_path(path):
+        return None
+    return os.path.realpath(os.path.expanduser(path.strip(_PATH_STRIP_CHARS)))
+
+
+def _remember_path(cache: 'OrderedDict[str, float]', path: str, expiry: float) -> None:
+    """Cache a validation result, evicting the oldest entry when full."""
+    # Re-inserting moves a refreshed path to the end of the eviction order
+    cache.pop(path, None)
+    cache[path] = expiry
+    if len(cache) > _PATH_CACHE_MAX_ENTRIES:
+        cache.popitem(last=False)
+
+
+def invalidate_path(path: str) -> None:
+    """
+    Drop a directory from the validate_path caches.
     
-    except (OSError, ValueError, RuntimeError, PermissionError) as e:
-        # Handle any path-related errors
-        return False
+    Call this after an operation that may have created, removed or
+    replaced the directory, so the next validation checks the
+    filesystem again.
+    
+    Args:
+        path: The directory path as passed to validate_path
+    """
+    if isinstance(path, str):
+        path = path.strip(_PATH_STRIP_CHARS)
+        _PATH_CACHE.pop(path, None)
+        _NEG_PATH_CACHE.pop(path, None)
 
 
 def format_file_size(bytes: int) -> str:
@@ -69,7 +165,8 @@ def format_file_size(bytes: int) -> str:
     Convert bytes to human-readable format (KB, MB, GB, TB).
     
     This function takes a file size in bytes and converts it to a
-    human-readable string with appropriate units.
+    human-readable string with appropriate units. Results are cached,
+    since listings repeat the same sizes (e.g. duplicate groups).
     
     Args:
         bytes: File size in bytes
@@ -88,21 +185,23 @@ def format_file_size(bytes: int) -> str:
     if not isinstance(bytes, (int, float)) or bytes < 0:
         return "0 B"
     
-    # Define size units
-    units = ['B', 'KB', 'MB', 'GB', 'TB']
-    size = float(bytes)
-    unit_index = 0
-    
-    # Convert to appropriate unit
-    while size >= 1024.0 and unit_index < len(units) - 1:
-        size /= 1024.0
-        unit_index += 1
+    return _format_file_size(bytes)
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_file_size(bytes: int) -> str:
+    """Cached formatting for format_file_size (input already validated)."""
+    if bytes < 1024:  # Bytes - no decimal places
+        return f"{int(bytes)} B"
     
-    # Format with appropriate precision
-    if unit_index == 0:  # Bytes - no decimal places
-        return f"{int(size)} {units[unit_index]}"
+    # Units are powers of 1024, so the unit index follows directly from the
+    # bit length (sizes of 1024 TB and up, including inf, stay in TB)
+    if bytes >= _SIZE_DIVISORS[-1] << 10:
+        unit_index = len(_SIZE_UNITS) - 1
     else:
-        return f"{size:.1f} {units[unit_index]}"
+        unit_index = (int(bytes).bit_length() - 1) // 10
+    
+    return f"{bytes / _SIZE_DIVISORS[unit_index]:.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def sanitize_filename(name: str) -> str:
@@ -128,15 +227,20 @@ def sanitize_filename(name: str) -> str:
     if not name or not isinstance(name, str):
         return "unnamed"
     
-    # Replace spaces with underscores
-    name = name.replace(' ', '_')
+    # Already-clean names (the common case) need no rewriting
+    if _CLEAN_RE.fullmatch(name):
+        return name
     
-    # Remove or replace special characters
-    # Keep only alphanumeric, underscores, hyphens, and periods
-    name = re.sub(r'[^\w\-.]', '', name)
+    # Replace spaces with underscores and remove special characters,
+    # keeping only alphanumeric, underscores, hyphens, and periods
+    if name.isascii():
+        name = name.translate(_SANITIZE_TABLE)
+    else:
+        # Unicode letters and digits count as word characters
+        name = _BAD_CHARS.sub('', name.replace(' ', '_'))
     
     # Remove multiple consecutive underscores
-    name = re.sub(r'_+', '_', name)
+    name = _MULTI_UNDERSCORE.sub('_', name)
     
     # Remove leading/trailing underscores and periods
     name = name.strip('_.')
@@ -148,6 +252,74 @@ def sanitize_filename(name: str) -> str:
     return name
 
 
+class _ConsoleHandler(logging.StreamHandler):
+    """Stream handler that formats 'LEVEL - message' with a plain f-string."""
+    
+    def format(self, record: logging.LogRecord) -> str:
+        # Tracebacks still go through the regular Formatter
+        if record.exc_info or record.stack_info:
+            return super().format(record)
+        return f"{record.levelname} - {record.getMessage()}"
+
+
+def _make_handlers(log_file: str, level: int) -> tuple[logging.Handler, logging.Handler]:
+    """Build the file and console handlers used by the application logger."""
+    # Create formatters
+    file_formatter = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    console_formatter = logging.Formatter(
+        '%(levelname)s - %(message)s'
+    )
+    
+    # File handler
+    file_handler = logging.FileHandler(log_file, encoding='utf-8')
+    file_handler.setLevel(level)
+    file_handler.setFormatter(file_formatter)
+    
+    # Console handler
+    console_handler = _ConsoleHandler()
+    console_handler.setLevel(logging.WARNING)  # Only warnings and errors to console
+    console_handler.setFormatter(console_formatter)
+    
+    return file_handler, console_handler
+
+
+def setup_worker_logging(log_file: str = "logs/file_management.log",
+                         level: int = logging.INFO) -> logging.Logger:
+    """
+    Set up logging inside a worker process.
+    
+    A forked worker inherits the parent's queue handler but not the
+    listener thread that drains it, so its records would never be
+    written; a spawned worker starts with no handlers at all. This
+    replaces any inherited handlers with file and console handlers that
+    write directly. Use it as a process pool initializer.
+    
+    Args:
+        log_file: Path to the log file (default: "logs/file_management.log")
+        level: Logging level (default: logging.INFO)
+        
+    Returns:
+        logging.Logger: Configured logger instance
+    """
+    global _LOGGER_READY
+    log_dir = os.path.dirname(log_file)
+    if log_dir:
+        os.makedirs(log_dir, exist_ok=True)
+    
+    logger = _DEFAULT_LOGGER
+    logger.setLevel(level)
+    for handler in list(logger.handlers):
+        logger.removeHandler(handler)
+    for handler in _make_handlers(log_file, level):
+        logger.addHandler(handler)
+    
+    _LOGGER_READY = logger
+    return logger
+
+
 def setup_logging(log_file: str = "logs/file_management.log", 
                   level: int = logging.INFO) -> logging.Logger:
     """
@@ -155,6 +327,9 @@ def setup_logging(log_file: str = "logs/file_management.log",
     
     This function configures the logging system to write to both
     a file and the console, with timestamps and appropriate formatting.
+    Records are written by a background thread, so logging calls return
+    without waiting on disk I/O. Only the first call configures logging;
+    later calls return the same logger without doing any work.
     
     Args:
         log_file: Path to the log file (default: "logs/file_management.log")
@@ -167,40 +342,43 @@ def setup_logging(log_file: str = "logs/file_management.log",
         >>> logger = setup_logging()
         >>> logger.info("Operation started")
     """
+    global _LOGGER_READY
+    if _LOGGER_READY is not None:
+        return _LOGGER_READY
+    
+    # Only needed to configure logging, so not imported with the module
+    import queue
+    import atexit
+    import logging.handlers
+    
     # Create logs directory if it doesn't exist
     log_dir = os.path.dirname(log_file)
-    if log_dir and not os.path.exists(log_dir):
+    if log_dir:
         os.makedirs(log_dir, exist_ok=True)
     
     # Create logger
-    logger = logging.getLogger('file_management_system')
+    logger = _DEFAULT_LOGGER
     logger.setLevel(level)
     
     # Avoid adding duplicate handlers
     if logger.handlers:
+        _LOGGER_READY = logger
         return logger
     
-    # Create formatters
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
-    console_formatter = logging.Formatter(
-        '%(levelname)s - %(message)s'
-    )
-    
-    # File handler
-    file_handler = logging.FileHandler(log_file, encoding='utf-8')
-    file_handler.setLevel(level)
-    file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+    file_handler, console_handler = _make_handlers(log_file, level)
     
-    # Console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.WARNING)  # Only warnings and errors to console
-    console_handler.setFormatter(console_formatter)
-    logger.addHandler(console_handler)
+    # Logging calls only enqueue the record; a background listener thread
+    # owns the real handlers and does the writes. Stopping the listener at
+    # exit flushes whatever is still queued.
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
+    _LOGGER_READY = logger
     return logger
 
 
@@ -220,11 +398,14 @@ def log_operation(operation: str, details: dict, logger: Optional[logging.Logger
         >>> log_operation("organize", {"files_processed": 10, "errors": 0})
     """
     if logger is None:
-        logger = logging.getLogger('file_management_system')
+        logger = _DEFAULT_LOGGER
+    
+    # Don't build the message when INFO records would be dropped anyway
+    if not logger.isEnabledFor(logging.INFO):
+        return
     
-    log_message = f"Operation: {operation}"
     if details:
         detail_str = ", ".join([f"{k}={v}" for k, v in details.items()])
-        log_message += f" | {detail_str}"
-    
-    logger.info(log_message)
+        logger.info("Operation: %s | %s", operation, detail_str)
+    else:
+        logger.info("Operation: %s", operation)